@@ -1,18 +1,25 @@
 #!/usr/bin/env python3
 """Diagnose why papers might be re-sent or why sent_papers.csv keeps growing."""
 
-import hashlib
 import os
 import sys
+from itertools import groupby
 from pathlib import Path
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+from article_checker.services.cache import sent_day
 from article_checker.services.gist_store import GistStore
-from article_checker.sources import ArxivSource, JournalSource
+from article_checker.sources import ArxivSource, JournalSource, fetch_many
 
 SENT_COLS = [
-    "paper_id", "doi", "title", "source", "source_symbol", "sent_at", "citation_label",
+    "paper_id", "doi", "title", "source", "source_symbol", "sent_at", "sent_at_day",
+    "citation_label",
 ]
 
 
@@ -29,40 +36,39 @@ def main():
     print(f"=== Gist: {len(gist_data)} sent papers ===\n")
 
     # Show sent_at range
-    dates = sorted(r.get("sent_at", "")[:10] for r in gist_data.values())
+    dates = sorted(sent_day(r) for r in gist_data.values())
     if dates:
         print(f"  Date range: {dates[0]} .. {dates[-1]}")
-        from collections import Counter
-        date_counts = Counter(dates)
-        for d, c in sorted(date_counts.items()):
-            print(f"    {d}: {c} papers")
+        for d, group in groupby(dates):
+            print(f"    {d}: {sum(1 for _ in group)} papers")
     print()
 
     # 2. Fetch RSS
     config_path = Path(__file__).parent.parent / "config" / "feeds.yaml"
     with open(config_path) as f:
-        feeds = yaml.safe_load(f)
+        feeds = yaml.load(f, Loader=SafeLoader)
+
+    arxiv_cfgs = feeds.get("arxiv", [])
+    journal_cfgs = feeds.get("journals", [])
+    sources = [ArxivSource(cfg) for cfg in arxiv_cfgs]
+    sources += [JournalSource(cfg) for cfg in journal_cfgs]
+    labels = [f"arXiv {cfg['category']}" for cfg in arxiv_cfgs]
+    labels += [cfg["name"] for cfg in journal_cfgs]
+    max_workers = feeds.get("settings", {}).get("fetch_workers", 8)
 
     all_papers = []
-    for cfg in feeds.get("arxiv", []):
-        src = ArxivSource(cfg)
-        papers = src.fetch()
-        print(f"  arXiv {cfg['category']}: {len(papers)} papers (after keyword filter)")
-        all_papers.extend(papers)
-    for cfg in feeds.get("journals", []):
-        src = JournalSource(cfg)
-        papers = src.fetch()
-        print(f"  {cfg['name']}: {len(papers)} papers (after keyword filter)")
+    for label, papers in zip(labels, fetch_many(sources, max_workers=max_workers)):
+        print(f"  {label}: {len(papers)} papers (after keyword filter)")
         all_papers.extend(papers)
 
     print(f"\n  Total RSS papers: {len(all_papers)}\n")
 
     # 3. Check matching
+    sent_ids = {r["paper_id"] for r in gist_data.values()}
     matched = []
     unmatched = []
     for p in all_papers:
-        key = hashlib.md5(p.id.encode()).hexdigest()
-        if key in gist_data:
+        if p.id in sent_ids:
             matched.append(p)
         else:
             unmatched.append(p)
@@ -73,6 +79,11 @@ def main():
     print()
 
     if unmatched:
+        # Index gist rows by title prefix for O(1) duplicate-title lookup
+        title_prefix_index = {}
+        for r in gist_data.values():
+            title_prefix_index.setdefault(r.get("title", "")[:30], r)
+
         print(f"=== Unmatched papers (first 10) ===")
         for p in unmatched[:10]:
             print(f"  paper.id: {p.id[:80]}")
@@ -80,11 +91,10 @@ def main():
             print(f"  title:    {p.title[:60]}")
             print(f"  source:   {p.source}")
             # Check if same title exists in gist with different ID
-            for r in gist_data.values():
-                if p.title[:30] in r.get("title", ""):
-                    print(f"  !! DUPLICATE TITLE in Gist with different ID:")
-                    print(f"     gist paper_id: {r['paper_id'][:80]}")
-                    break
+            dup = title_prefix_index.get(p.title[:30])
+            if dup:
+                print(f"  !! DUPLICATE TITLE in Gist with different ID:")
+                print(f"     gist paper_id: {dup['paper_id'][:80]}")
             print()
 
     # 4. Check max_papers_per_run
@@ -10,20 +10,25 @@ groups papers by source, and sends batch email notifications
 import argparse
 import logging
 import os
-import sys
 from collections import defaultdict
 from pathlib import Path
 
 import yaml
 
-from article_checker.sources import ArxivSource, JournalSource
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+from article_checker.sources import ArxivSource, FeedCache, JournalSource, fetch_many
 from article_checker.services import AuthorEvaluator, EmailSender, CacheManager
 from article_checker.services.gist_store import GistStore
 from article_checker.models import Paper
 
 # CSV column definitions for GistStore
 SENT_PAPERS_COLUMNS = [
-    "paper_id", "doi", "title", "source", "source_symbol", "sent_at", "citation_label",
+    "paper_id", "doi", "title", "source", "source_symbol", "sent_at", "sent_at_day",
+    "citation_label",
 ]
 AUTHOR_CACHE_COLUMNS = [
     "name", "h_index", "citation_count", "paper_count", "url", "cached_at",
@@ -41,7 +46,7 @@ def load_config(config_dir: Path) -> tuple[dict, dict]:
     feeds_path = config_dir / "feeds.yaml"
 
     with open(feeds_path, "r") as f:
-        feeds_config = yaml.safe_load(f)
+        feeds_config = yaml.load(f, Loader=SafeLoader)
 
     # Email config from environment variables only (for security)
     email_config = {
@@ -61,19 +66,15 @@ def load_config(config_dir: Path) -> tuple[dict, dict]:
     return feeds_config, email_config
 
 
-def fetch_all_papers(feeds_config: dict) -> list[Paper]:
-    """Fetch papers from all configured sources."""
-    papers = []
-
-    # Fetch from arXiv
-    for arxiv_config in feeds_config.get("arxiv", []):
-        source = ArxivSource(arxiv_config)
-        papers.extend(source.fetch())
+def fetch_all_papers(feeds_config: dict, feed_cache: FeedCache | None = None) -> list[Paper]:
+    """Fetch papers from all configured sources concurrently."""
+    sources = [ArxivSource(c, feed_cache) for c in feeds_config.get("arxiv", [])]
+    sources += [JournalSource(c, feed_cache) for c in feeds_config.get("journals", [])]
 
-    # Fetch from journals
-    for journal_config in feeds_config.get("journals", []):
-        source = JournalSource(journal_config)
-        papers.extend(source.fetch())
+    max_workers = feeds_config.get("settings", {}).get("fetch_workers", 8)
+    papers = []
+    for fetched in fetch_many(sources, max_workers=max_workers):
+        papers.extend(fetched)
 
     return papers
 
@@ -126,12 +127,12 @@ def main():
         sent_papers_store=sent_store,
         author_cache_store=author_store,
     )
-    evaluator = AuthorEvaluator(cache)
-    sender = EmailSender(email_config)
 
     # Fetch papers from all sources
     logger.info("Fetching papers from all sources...")
-    all_papers = fetch_all_papers(feeds_config)
+    feed_cache = FeedCache(args.cache_dir / "feeds")
+    all_papers = fetch_all_papers(feeds_config, feed_cache)
+    feed_cache.save()
     logger.info(f"Found {len(all_papers)} papers total")
 
     # Filter out already-sent papers
@@ -156,35 +157,44 @@ def main():
     evaluate_authors = settings.get("evaluate_authors", True)
     max_authors = settings.get("max_authors_to_evaluate", 5)
 
-    for i, paper in enumerate(papers, 1):
-        logger.info(f"\n[{i}/{len(papers)}] Evaluating: {paper.title[:60]}...")
+    with AuthorEvaluator(cache) as evaluator:
+        for i, paper in enumerate(papers, 1):
+            logger.info(f"\n[{i}/{len(papers)}] Evaluating: {paper.title[:60]}...")
 
-        if evaluate_authors and paper.authors and paper.arxiv_id is not None:
-            evaluator.evaluate_paper(paper, max_authors=max_authors)
-            logger.info(f"  Max h-index: {paper.max_h_index} ({paper.score_label})")
-        elif paper.arxiv_id is None:
-            paper.set_journal_score()
-            logger.info(f"  Journal paper — skipping author evaluation")
+            if evaluate_authors and paper.authors and paper.arxiv_id is not None:
+                evaluator.evaluate_paper(paper, max_authors=max_authors)
+                logger.info(f"  Max h-index: {paper.max_h_index} ({paper.score_label})")
+            elif paper.arxiv_id is None:
+                paper.set_journal_score()
+                logger.info(f"  Journal paper — skipping author evaluation")
 
     # ── Phase 2: Group by source and batch send ────────────────────
     papers_by_source: dict[str, list[Paper]] = defaultdict(list)
     for paper in papers:
         papers_by_source[paper.source].append(paper)
 
-    sent_count = 0
-    for source, source_papers in papers_by_source.items():
-        source_symbol = source_papers[0].source_symbol or source
+    batches = [
+        (source, source_papers[0].source_symbol or source, source_papers)
+        for source, source_papers in papers_by_source.items()
+    ]
+    for source, source_symbol, source_papers in batches:
         logger.info(
             f"\nSending batch for [{source_symbol}]: {len(source_papers)} papers"
         )
-
         if args.dry_run:
             logger.info("  [DRY RUN] Would send batch email")
             for p in source_papers:
                 logger.info(f"    - {p.get_score_emoji()} {p.title[:60]}")
-            continue
 
-        if sender.send_batch(source, source_symbol, source_papers):
+    sent_count = 0
+    if not args.dry_run:
+        with EmailSender(email_config) as sender:
+            results = sender.send_all(batches)
+
+        for (source, _, source_papers), ok in zip(batches, results):
+            if not ok:
+                logger.warning(f"  Failed to send batch email for source: {source}")
+                continue
             for paper in source_papers:
                 cache.mark_paper_sent(
                     paper.id,
@@ -195,8 +205,6 @@ def main():
                     citation_label=EmailSender.build_citation_label(paper),
                 )
                 sent_count += 1
-        else:
-            logger.warning(f"  Failed to send batch email for source: {source}")
 
     # Save cache
     cache.save()
@@ -12,12 +12,18 @@ from pathlib import Path
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 from article_checker.services import CacheManager, EmailSender
 from article_checker.services.gist_store import GistStore
-from article_checker.sources import ArxivSource, JournalSource
+from article_checker.sources import ArxivSource, JournalSource, fetch_many
 
 SENT_PAPERS_COLUMNS = [
-    "paper_id", "doi", "title", "source", "source_symbol", "sent_at", "citation_label",
+    "paper_id", "doi", "title", "source", "source_symbol", "sent_at", "sent_at_day",
+    "citation_label",
 ]
 AUTHOR_CACHE_COLUMNS = [
     "name", "h_index", "citation_count", "paper_count", "url", "cached_at",
@@ -37,19 +43,20 @@ def main():
     # Load feeds config
     config_path = Path(__file__).parent.parent / "config" / "feeds.yaml"
     with open(config_path) as f:
-        feeds = yaml.safe_load(f)
+        feeds = yaml.load(f, Loader=SafeLoader)
 
     # Fetch all papers from all sources (with keyword filters applied)
+    arxiv_cfgs = feeds.get("arxiv", [])
+    journal_cfgs = feeds.get("journals", [])
+    sources = [ArxivSource(cfg) for cfg in arxiv_cfgs]
+    sources += [JournalSource(cfg) for cfg in journal_cfgs]
+    labels = [f"arXiv {cfg['category']}" for cfg in arxiv_cfgs]
+    labels += [cfg["name"] for cfg in journal_cfgs]
+    max_workers = feeds.get("settings", {}).get("fetch_workers", 8)
+
     all_papers = []
-    for cfg in feeds.get("arxiv", []):
-        src = ArxivSource(cfg)
-        papers = src.fetch()
-        logger.info(f"arXiv {cfg['category']}: {len(papers)} papers")
-        all_papers.extend(papers)
-    for cfg in feeds.get("journals", []):
-        src = JournalSource(cfg)
-        papers = src.fetch()
-        logger.info(f"{cfg['name']}: {len(papers)} papers")
+    for label, papers in zip(labels, fetch_many(sources, max_workers=max_workers)):
+        logger.info(f"{label}: {len(papers)} papers")
         all_papers.extend(papers)
 
     logger.info(f"Total: {len(all_papers)} papers to seed")
@@ -63,19 +70,21 @@ def main():
         author_cache_store=author_store,
     )
 
-    # Mark all papers as sent
-    new_count = 0
+    # Mark all papers as sent in one batch
+    sent = cache.sent_id_set()
+    rows = []
     for paper in all_papers:
-        if not cache.is_paper_sent(paper.id):
-            cache.mark_paper_sent(
-                paper.id,
-                paper.title,
-                paper.source,
-                doi=paper.doi or "",
-                source_symbol=paper.source_symbol,
-                citation_label=EmailSender.build_citation_label(paper),
-            )
-            new_count += 1
+        if paper.id not in sent:
+            rows.append({
+                "paper_id": paper.id,
+                "title": paper.title,
+                "source": paper.source,
+                "doi": paper.doi or "",
+                "source_symbol": paper.source_symbol,
+                "citation_label": EmailSender.build_citation_label(paper),
+            })
+            sent.add(paper.id)
+    new_count = cache.mark_papers_sent_bulk(rows)
 
     logger.info(f"Newly seeded: {new_count} papers (skipped {len(all_papers) - new_count} already in cache)")
 
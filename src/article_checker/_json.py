@@ -0,0 +1,27 @@
+"""JSON codec shim: orjson when installed (the ``fast`` extra), else stdlib json.
+
+Both paths take str or bytes in ``loads`` and return compact UTF-8 bytes
+from ``dumps``, so callers never branch on which one is in use.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document."""
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes."""
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
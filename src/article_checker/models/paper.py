@@ -1,8 +1,31 @@
 """Paper and Author data models."""
 
+import sys
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, NamedTuple, Optional
+from functools import lru_cache
+from typing import List, NamedTuple, Optional, Tuple
+
+# Lower h-index bound of each score tier above the lowest one
+_SCORE_THRESHOLDS = (10, 20, 50, 100)
+
+# (label, css class, emoji) per tier, indexed by bisect over _SCORE_THRESHOLDS
+_SCORE_TIERS = (
+    ("若手研究者", "score-c", "⚪"),
+    ("注目研究者", "score-b", "🔵"),
+    ("中核研究者", "score-a", "🟢"),
+    ("トップ研究者", "score-s", "🏅"),
+    ("世界的権威", "score-s-plus", "🏆"),
+)
+
+# Tier used for journal papers, which skip h-index evaluation
+_JOURNAL_TIER = ("ジャーナル掲載", "score-journal", "📄")
+
+
+def _score_tier(h_index: int) -> Tuple[str, str, str]:
+    """Return (label, css class, emoji) for the tier containing h_index."""
+    return _SCORE_TIERS[bisect_right(_SCORE_THRESHOLDS, h_index)]
 
 
 class AuthorName(NamedTuple):
@@ -13,16 +36,21 @@ class AuthorName(NamedTuple):
     fullname: str
 
 
+@lru_cache(maxsize=8192)
 def parse_author_name(name: str) -> AuthorName:
-    """Parse a name string into AuthorName, splitting on the last space."""
-    name = name.strip()
+    """Parse a name string into AuthorName, splitting on the last space.
+
+    Memoized: co-authors recur across a feed, and AuthorName is immutable,
+    so repeated names return the same object.
+    """
+    name = sys.intern(name.strip())
     if " " in name:
         firstname, lastname = name.rsplit(" ", 1)
-        return AuthorName(firstname=firstname, lastname=lastname, fullname=name)
+        return AuthorName(firstname=firstname, lastname=sys.intern(lastname), fullname=name)
     return AuthorName(firstname="", lastname=name, fullname=name)
 
 
-@dataclass
+@dataclass(slots=True)
 class Author:
     """Represents a paper author with optional Semantic Scholar metrics."""
 
@@ -42,7 +70,7 @@ class Author:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Paper:
     """
     Unified paper representation across different sources.
@@ -72,51 +100,47 @@ class Paper:
 
     # Computed fields (set after author evaluation)
     max_h_index: int = 0
-    score_label: str = ""
-    score_class: str = ""
+
+    # Score tier (label, css class, emoji); None until scored
+    _tier: Optional[Tuple[str, str, str]] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Low-cardinality labels: collapse equal values onto one string object
+        self.source = sys.intern(self.source)
+        self.source_symbol = sys.intern(self.source_symbol)
+
+    @property
+    def score_label(self) -> str:
+        """Human-readable score tier, empty until scored."""
+        return self._tier[0] if self._tier else ""
+
+    @property
+    def score_class(self) -> str:
+        """CSS class of the score tier, empty until scored."""
+        return self._tier[1] if self._tier else ""
 
     def compute_score(self) -> None:
         """Compute score based on max h-index of authors."""
-        if self.authors:
-            h_indices = [a.h_index for a in self.authors if a.h_index is not None]
-            self.max_h_index = max(h_indices) if h_indices else 0
-
-        # Set score label and class based on max h-index
-        if self.max_h_index >= 100:
-            self.score_label = "世界的権威"
-            self.score_class = "score-s-plus"
-        elif self.max_h_index >= 50:
-            self.score_label = "トップ研究者"
-            self.score_class = "score-s"
-        elif self.max_h_index >= 20:
-            self.score_label = "中核研究者"
-            self.score_class = "score-a"
-        elif self.max_h_index >= 10:
-            self.score_label = "注目研究者"
-            self.score_class = "score-b"
-        else:
-            self.score_label = "若手研究者"
-            self.score_class = "score-c"
+        max_h = max(
+            (a.h_index for a in self.authors if a.h_index is not None), default=-1
+        )
+        if max_h < 0:
+            # No author metrics available: lowest tier without a lookup
+            self.max_h_index = 0
+            self._tier = _SCORE_TIERS[0]
+            return
+
+        # Set score tier based on max h-index
+        self.max_h_index = max_h
+        self._tier = _score_tier(max_h)
 
     def set_journal_score(self) -> None:
         """Set score for journal papers (skip h-index evaluation)."""
-        self.score_label = "ジャーナル掲載"
-        self.score_class = "score-journal"
+        self._tier = _JOURNAL_TIER
 
     def get_score_emoji(self) -> str:
         """Get emoji based on score."""
-        if self.score_class == "score-journal":
-            return "📄"
-        elif self.max_h_index >= 100:
-            return "🏆"
-        elif self.max_h_index >= 50:
-            return "🏅"
-        elif self.max_h_index >= 20:
-            return "🟢"
-        elif self.max_h_index >= 10:
-            return "🔵"
-        else:
-            return "⚪"
+        return (self._tier or _score_tier(self.max_h_index))[2]
 
     def to_dict(self) -> dict:
         return {
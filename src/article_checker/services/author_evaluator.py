@@ -1,13 +1,21 @@
 """Author evaluation service using Semantic Scholar API."""
 
+import random
+import re
+import threading
 import time
 import logging
-from typing import Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Deque, Dict, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ..models import Paper, Author
 from .cache import CacheManager
+from .. import _json
 
 logger = logging.getLogger(__name__)
 
@@ -19,11 +27,14 @@ class AuthorEvaluator:
     Features:
     - Fetches h-index, citation count, paper count
     - Caches results to reduce API calls
-    - Respects rate limits
+    - Respects rate limits (token bucket ceiling, backoff on HTTP 429)
     """
 
     API_BASE = "https://api.semanticscholar.org/graph/v1"
-    RATE_LIMIT_DELAY = 1.0  # seconds between requests
+    MAX_REQUESTS_PER_SECOND = 1  # ceiling on API request rate
+    MAX_RETRIES = 3  # retries after an HTTP 429 response
+    MAX_BACKOFF = 30.0  # seconds, cap on a single retry wait
+    MAX_WORKERS = 8  # upper bound on concurrent author searches per paper
 
     def __init__(self, cache_manager: CacheManager):
         """
@@ -34,70 +45,166 @@ class AuthorEvaluator:
         """
         self.cache = cache_manager
         self.session = requests.Session()
-        self.session.headers.update({"User-Agent": "ArticleChecker/1.0"})
+        self.session.headers.update(
+            {
+                "User-Agent": "ArticleChecker/1.0",
+                "Connection": "keep-alive",
+                "Accept-Encoding": "gzip",
+            }
+        )
+        # Pooled keep-alive connections; transient 5xx and connection errors
+        # are retried here, while 429 is handled by _search_author
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(
+                total=3, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504]
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self._request_times: Deque[float] = deque()
+        self._throttle_lock = threading.Lock()
+
+        # Metrics resolved during this run, keyed by full name; None marks
+        # authors that could not be resolved, so they are not retried per paper
+        self._run_cache: Dict[str, Optional[dict]] = {}
+
+    def close(self) -> None:
+        """Close pooled HTTP connections."""
+        self.session.close()
+
+    def __enter__(self) -> "AuthorEvaluator":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
 
     def evaluate_paper(self, paper: Paper, max_authors: int = 5) -> None:
         """
         Evaluate all authors of a paper.
 
+        Name searches run concurrently, but the API rate limit
+        (MAX_REQUESTS_PER_SECOND) caps the speedup.
+
         Args:
             paper: Paper object to evaluate
             max_authors: Maximum number of authors to evaluate (to save API calls)
         """
         logger.info(f"Evaluating authors for: {paper.title[:50]}...")
 
-        for i, author in enumerate(paper.authors[:max_authors]):
-            self._evaluate_author(author)
-            if i < len(paper.authors) - 1:
-                time.sleep(self.RATE_LIMIT_DELAY)
+        pending = [
+            a for a in paper.authors[:max_authors]
+            if a.name.fullname and not self._load_cached(a)
+        ]
+        if pending:
+            # One paper lookup resolves all authors; unmatched ones are searched by name
+            resolved = self._fetch_paper_authors(paper)
+            unmatched = [a for a in pending if a.name.fullname.casefold() not in resolved]
+            if unmatched:
+                # The rate limit caps the speedup: beyond two requests per slot
+                # (one in flight, one waiting), extra workers would only sleep
+                workers = min(self.MAX_WORKERS, self.MAX_REQUESTS_PER_SECOND * 2, len(unmatched))
+                with ThreadPoolExecutor(max_workers=workers) as ex:
+                    results = ex.map(self._search_author, [a.name.fullname for a in unmatched])
+                    for author, data in zip(unmatched, results):
+                        resolved[author.name.fullname.casefold()] = data
+
+            for author in pending:
+                self._evaluate_author(author, resolved[author.name.fullname.casefold()])
 
         # Compute paper score based on author h-indices
         paper.compute_score()
 
-    def _evaluate_author(self, author: Author) -> None:
+    def _load_cached(self, author: Author) -> bool:
+        """
+        Populate author metrics from the run cache or the persistent cache.
+
+        Returns:
+            True if the author needs no API lookup
         """
-        Evaluate a single author.
+        name = author.name.fullname
+        if name in self._run_cache:
+            cached = self._run_cache[name]
+            if cached is None:
+                return True
+        else:
+            cached = self.cache.get_author(name)
+            if not cached or cached.get("h_index") is None:
+                # Rows without an h-index are treated as missing and looked up
+                return False
+            self._run_cache[name] = cached
+        author.h_index = cached.get("h_index")
+        author.citation_count = cached.get("citation_count")
+        author.paper_count = cached.get("paper_count")
+        author.semantic_scholar_url = cached.get("url")
+        logger.debug(f"Cache hit for author: {author.name.fullname}")
+        return True
+
+    def _evaluate_author(self, author: Author, data: Optional[dict]) -> None:
+        """
+        Populate an author from fetched metrics and cache them.
 
         Args:
             author: Author object to populate with metrics
+            data: Semantic Scholar author data, or None if not found
         """
-        if not author.name.fullname:
-            return
-
-        # Check cache first
-        cached = self.cache.get_author(author.name.fullname)
-        if cached:
-            author.h_index = cached.get("h_index")
-            author.citation_count = cached.get("citation_count")
-            author.paper_count = cached.get("paper_count")
-            author.semantic_scholar_url = cached.get("url")
-            logger.debug(f"Cache hit for author: {author.name.fullname}")
-            return
-
-        # Query Semantic Scholar API
         try:
-            data = self._search_author(author.name.fullname)
-            if data:
+            if not data:
+                self._run_cache[author.name.fullname] = None
+            else:
                 author.h_index = data.get("hIndex", 0)
                 author.citation_count = data.get("citationCount", 0)
                 author.paper_count = data.get("paperCount", 0)
                 author.semantic_scholar_url = data.get("url", "")
 
                 # Cache the result
-                self.cache.set_author(
-                    author.name.fullname,
-                    {
-                        "h_index": author.h_index,
-                        "citation_count": author.citation_count,
-                        "paper_count": author.paper_count,
-                        "url": author.semantic_scholar_url,
-                    },
-                )
+                record = {
+                    "h_index": author.h_index,
+                    "citation_count": author.citation_count,
+                    "paper_count": author.paper_count,
+                    "url": author.semantic_scholar_url,
+                }
+                self.cache.set_author(author.name.fullname, record)
+                self._run_cache[author.name.fullname] = record
                 logger.debug(f"Evaluated author: {author.name.fullname} (h-index: {author.h_index})")
 
         except Exception as e:
             logger.warning(f"Failed to evaluate author {author.name.fullname}: {e}")
 
+    def _fetch_paper_authors(self, paper: Paper) -> Dict[str, dict]:
+        """
+        Fetch metrics for all authors of a paper in a single request.
+
+        Args:
+            paper: Paper with an arXiv ID or DOI
+
+        Returns:
+            Author data dicts keyed by casefolded author name
+        """
+        if paper.arxiv_id:
+            paper_id = "arXiv:" + re.sub(r"v\d+$", "", paper.arxiv_id)
+        elif paper.doi:
+            paper_id = f"DOI:{paper.doi}"
+        else:
+            return {}
+
+        try:
+            params = {
+                "fields": "authors.name,authors.hIndex,authors.citationCount,"
+                "authors.paperCount,authors.url",
+            }
+            response = self._get(f"{self.API_BASE}/paper/{paper_id}", params)
+            if response.status_code == 404:
+                return {}
+            response.raise_for_status()
+            authors = _json.loads(response.content).get("authors") or []
+
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.warning(f"API error for paper {paper_id}: {e}")
+            return {}
+
+        return {a["name"].casefold(): a for a in authors if a.get("name")}
+
     def _search_author(self, name: str) -> Optional[dict]:
         """
         Search for an author on Semantic Scholar.
@@ -117,18 +224,63 @@ class AuthorEvaluator:
                 "limit": 1,
             }
 
-            response = self.session.get(search_url, params=params, timeout=10)
+            response = self._get(search_url, params)
             response.raise_for_status()
 
-            data = response.json()
+            data = _json.loads(response.content)
             if data.get("data") and len(data["data"]) > 0:
                 return data["data"][0]
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             logger.warning(f"API error for author {name}: {e}")
 
         return None
 
+    def _get(self, url: str, params: dict) -> requests.Response:
+        """GET from the API, rate limited and retried on HTTP 429."""
+        for attempt in range(self.MAX_RETRIES + 1):
+            self._throttle()
+            response = self.session.get(url, params=params, timeout=10)
+            if response.status_code != 429 or attempt == self.MAX_RETRIES:
+                break
+            delay = self._retry_delay(response, attempt)
+            logger.info(f"Rate limited by Semantic Scholar, retrying in {delay:.1f}s")
+            time.sleep(delay)
+        return response
+
+    def _throttle(self) -> None:
+        """
+        Wait for a request slot within the per-second budget.
+
+        A slot is reserved under the lock and the wait happens outside it,
+        so other threads can reserve the following slots meanwhile.
+        """
+        with self._throttle_lock:
+            now = time.monotonic()
+            while self._request_times and now - self._request_times[0] >= 1.0:
+                self._request_times.popleft()
+            start = now
+            if len(self._request_times) >= self.MAX_REQUESTS_PER_SECOND:
+                start = max(now, self._request_times[-self.MAX_REQUESTS_PER_SECOND] + 1.0)
+            self._request_times.append(start)
+        if start > now:
+            time.sleep(start - now)
+
+    def _retry_delay(self, response: requests.Response, attempt: int) -> float:
+        """
+        Seconds to wait before retrying a rate-limited request.
+
+        Honors a numeric Retry-After header, otherwise backs off
+        exponentially (1s, 2s, 4s, ...) with a little jitter.
+        """
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return min(float(retry_after), self.MAX_BACKOFF)
+            except ValueError:
+                pass
+        return min(2 ** attempt + random.uniform(0, 0.25), self.MAX_BACKOFF)
+
     def check_h_index_threshold(
         self, paper: Paper, min_h_index: int, check_first_n: int = 3
     ) -> bool:
@@ -146,16 +298,27 @@ class AuthorEvaluator:
         Returns:
             True if at least one author meets the threshold
         """
+        # Pass 1: cached authors only, no I/O
+        uncached = []
         for author in paper.authors[:check_first_n]:
-            # Check cache first
             cached = self.cache.get_author(author.name.fullname)
-            if cached and cached.get("h_index", 0) >= min_h_index:
+            h_index = cached.get("h_index") if cached else None
+            if h_index is None:
+                uncached.append(author)
+            elif h_index >= min_h_index:
                 return True
 
-            # Query API if not cached
-            data = self._search_author(author.name.fullname)
+        if not uncached:
+            return False
+
+        # Pass 2: one paper lookup, falling back to name search per author
+        resolved = self._fetch_paper_authors(paper)
+        for author in uncached:
+            data = resolved.get(author.name.fullname.casefold())
+            if data is None:
+                data = self._search_author(author.name.fullname)
             if data:
-                h_index = data.get("hIndex", 0)
+                h_index = data.get("hIndex") or 0
                 # Cache the result
                 self.cache.set_author(
                     author.name.fullname,
@@ -169,6 +332,4 @@ class AuthorEvaluator:
                 if h_index >= min_h_index:
                     return True
 
-            time.sleep(self.RATE_LIMIT_DELAY)
-
         return False
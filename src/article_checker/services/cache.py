@@ -1,15 +1,58 @@
 """Cache management for h-index and sent papers."""
 
-import hashlib
-import json
 import logging
+import sys
+import time
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional, Set
+
+from .. import _json
 
 logger = logging.getLogger(__name__)
 
 
+def sent_day(row: Dict[str, Any]) -> str:
+    """Return the YYYY-MM-DD send date of a sent-papers row.
+
+    Rows written before the sent_at_day column existed fall back to
+    slicing sent_at.
+    """
+    return row.get("sent_at_day") or row.get("sent_at", "")[:10]
+
+
+def _ensure_timestamp(data: Dict[str, Any], field: str) -> None:
+    """Set data[f"{field}_ts"] to the epoch value of the ISO data[field].
+
+    Missing or unparsable dates count as 2000-01-01 so they expire.
+    """
+    ts_field = f"{field}_ts"
+    if isinstance(data.get(ts_field), (int, float)):
+        return
+    try:
+        data[ts_field] = datetime.fromisoformat(data.get(field) or "2000-01-01").timestamp()
+    except ValueError:
+        data[ts_field] = datetime(2000, 1, 1).timestamp()
+
+
+def _to_int(value: Any) -> Optional[int]:
+    """Convert a stored metric to int; empty or unparsable values become None.
+
+    CSV-backed stores return every value as a string.
+    """
+    if value is None or isinstance(value, int):
+        return value
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+# Author metrics that must be ints for scoring and formatting
+_AUTHOR_INT_FIELDS = ("h_index", "citation_count", "paper_count")
+
+
 class CacheManager:
     """
     Manages caches for:
@@ -18,8 +61,15 @@ class CacheManager:
 
     Each cache can optionally delegate to an external store (e.g. GistStore).
     When no external store is provided, local JSON files are used.
+
+    Expiry is lazy: expired entries are ignored (and author entries dropped)
+    when read, and swept from storage on save() at most every
+    CLEANUP_INTERVAL seconds.
     """
 
+    SENT_PAPERS_WARN_SIZE = 10000  # warn when sent history grows past this
+    CLEANUP_INTERVAL = 3600  # seconds between expiry sweeps
+
     def __init__(
         self,
         cache_dir: Path,
@@ -43,6 +93,8 @@ class CacheManager:
 
         self.author_cache_expiry = timedelta(days=author_cache_expiry_days)
         self.sent_papers_expiry = timedelta(days=sent_papers_expiry_days)
+        self._author_expiry_s = self.author_cache_expiry.total_seconds()
+        self._sent_expiry_s = self.sent_papers_expiry.total_seconds()
 
         self._sent_papers_store = sent_papers_store
         self._author_cache_store = author_cache_store
@@ -53,6 +105,11 @@ class CacheManager:
 
         self._author_cache: Dict[str, Any] = {}
         self._sent_papers: Dict[str, Any] = {}
+        self._last_cleanup_ts = 0.0
+
+        # Keys changed since the last save; clean caches are not rewritten
+        self._dirty_authors: Set[str] = set()
+        self._dirty_papers: Set[str] = set()
 
         self._load_caches()
 
@@ -61,36 +118,73 @@ class CacheManager:
     def _load_caches(self) -> None:
         """Load caches from stores or local files."""
         if self._author_cache_store:
-            self._author_cache = self._author_cache_store.load()
+            authors = self._author_cache_store.load()
         else:
-            self._author_cache = self._load_json(self._author_cache_file)
+            authors = self._load_json(self._author_cache_file)
 
         if self._sent_papers_store:
-            self._sent_papers = self._sent_papers_store.load()
+            papers = self._sent_papers_store.load()
         else:
-            self._sent_papers = self._load_json(self._sent_papers_file)
+            papers = self._load_json(self._sent_papers_file)
 
-        self._cleanup_expired()
+        # Re-key by natural identifiers (stores and older files use MD5 keys)
+        self._author_cache = {
+            self._author_key(data["name"]): data
+            for data in authors.values()
+            if data.get("name")
+        }
+        self._sent_papers = {
+            self._paper_key(data["paper_id"]): data
+            for data in papers.values()
+            if data.get("paper_id")
+        }
+
+        # Entries carry epoch timestamps next to the ISO strings; rows from
+        # older files or CSV stores only have the ISO form, converted once here
+        # Names and source labels repeat across thousands of rows; intern them
+        # so equal values share one string object
+        for data in self._author_cache.values():
+            _ensure_timestamp(data, "cached_at")
+            data["name"] = sys.intern(data["name"])
+            for field in _AUTHOR_INT_FIELDS:
+                data[field] = _to_int(data.get(field))
+        for data in self._sent_papers.values():
+            _ensure_timestamp(data, "sent_at")
+            data["source"] = sys.intern(data.get("source") or "")
+            data["source_symbol"] = sys.intern(data.get("source_symbol") or "")
+
+        if len(self._sent_papers) > self.SENT_PAPERS_WARN_SIZE:
+            logger.warning(
+                f"Sent papers history has {len(self._sent_papers)} entries; "
+                f"consider lowering sent_papers_expiry_days"
+            )
 
     def save(self) -> None:
         """Save all caches to their respective stores."""
+        if time.time() - self._last_cleanup_ts > self.CLEANUP_INTERVAL:
+            self._cleanup_expired()
+
         # Author cache
-        if self._author_cache_store:
-            try:
-                self._author_cache_store.save(self._author_cache)
-            except Exception as e:
-                logger.error(f"Failed to save author cache to external store: {e}")
-        else:
-            self._save_json(self._author_cache_file, self._author_cache)
+        if self._dirty_authors:
+            if self._author_cache_store:
+                try:
+                    self._author_cache_store.save(self._author_cache)
+                    self._dirty_authors.clear()
+                except Exception as e:
+                    logger.error(f"Failed to save author cache to external store: {e}")
+            elif self._save_json(self._author_cache_file, self._author_cache):
+                self._dirty_authors.clear()
 
         # Sent papers
-        if self._sent_papers_store:
-            try:
-                self._sent_papers_store.save(self._sent_papers)
-            except Exception as e:
-                logger.error(f"Failed to save sent papers to external store: {e}")
-        else:
-            self._save_json(self._sent_papers_file, self._sent_papers)
+        if self._dirty_papers:
+            if self._sent_papers_store:
+                try:
+                    self._sent_papers_store.save(self._sent_papers)
+                    self._dirty_papers.clear()
+                except Exception as e:
+                    logger.error(f"Failed to save sent papers to external store: {e}")
+            elif self._save_json(self._sent_papers_file, self._sent_papers):
+                self._dirty_papers.clear()
 
     # ---- Local JSON helpers ----
 
@@ -99,45 +193,48 @@ class CacheManager:
         if not path.exists():
             return {}
         try:
-            with open(path, "r") as f:
-                return json.load(f)
+            return _json.loads(path.read_bytes())
         except Exception as e:
             logger.warning(f"Failed to load cache {path}: {e}")
             return {}
 
-    def _save_json(self, path: Path, data: Dict[str, Any]) -> None:
-        """Save data to JSON file."""
+    def _save_json(self, path: Path, data: Dict[str, Any]) -> bool:
+        """Save data to a compact JSON file, returning True on success."""
         try:
-            with open(path, "w") as f:
-                json.dump(data, f, indent=2)
+            path.write_bytes(_json.dumps(data))
+            return True
         except Exception as e:
             logger.warning(f"Failed to save cache {path}: {e}")
+            return False
 
     # ---- Expiry cleanup ----
 
     def _cleanup_expired(self) -> None:
         """Remove expired entries from caches."""
-        now = datetime.now()
+        now = time.time()
+        self._last_cleanup_ts = now
 
         # Cleanup author cache
+        author_cutoff = now - self._author_expiry_s
         expired_authors = [
             key
             for key, data in self._author_cache.items()
-            if now - datetime.fromisoformat(data.get("cached_at", "2000-01-01"))
-            > self.author_cache_expiry
+            if data["cached_at_ts"] < author_cutoff
         ]
         for key in expired_authors:
             del self._author_cache[key]
+        self._dirty_authors.update(expired_authors)
 
         # Cleanup sent papers
+        paper_cutoff = now - self._sent_expiry_s
         expired_papers = [
             key
             for key, data in self._sent_papers.items()
-            if now - datetime.fromisoformat(data.get("sent_at", "2000-01-01"))
-            > self.sent_papers_expiry
+            if data["sent_at_ts"] < paper_cutoff
         ]
         for key in expired_papers:
             del self._sent_papers[key]
+        self._dirty_papers.update(expired_papers)
 
         if expired_authors or expired_papers:
             logger.info(
@@ -147,38 +244,43 @@ class CacheManager:
 
     # ---- Author cache methods ----
 
-    def _author_key(self, name: str) -> str:
-        """Generate cache key for author name."""
-        normalized = name.lower().strip()
-        return hashlib.md5(normalized.encode()).hexdigest()
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _author_key(name: str) -> str:
+        """Generate cache key for author name (memoized, so once per name)."""
+        return name.strip().casefold()
 
     def get_author(self, name: str) -> Optional[Dict[str, Any]]:
         """Get cached author data."""
         key = self._author_key(name)
         data = self._author_cache.get(key)
-        if data:
-            cached_at = datetime.fromisoformat(data.get("cached_at", "2000-01-01"))
-            if datetime.now() - cached_at <= self.author_cache_expiry:
-                return data
-        return None
+        if data and data["cached_at_ts"] < time.time() - self._author_expiry_s:
+            # Expired: drop it now rather than waiting for the next sweep
+            del self._author_cache[key]
+            self._dirty_authors.add(key)
+            return None
+        return data
 
     def set_author(self, name: str, data: Dict[str, Any]) -> None:
         """Cache author data."""
         key = self._author_key(name)
-        data["cached_at"] = datetime.now().isoformat()
-        data["name"] = name
+        now = datetime.now()
+        data["cached_at"] = now.isoformat()
+        data["cached_at_ts"] = now.timestamp()
+        data["name"] = sys.intern(name)
         self._author_cache[key] = data
+        self._dirty_authors.add(key)
 
     # ---- Sent papers methods ----
 
     def _paper_key(self, paper_id: str) -> str:
         """Generate cache key for paper."""
-        return hashlib.md5(paper_id.encode()).hexdigest()
+        return paper_id
 
     def is_paper_sent(self, paper_id: str) -> bool:
         """Check if paper has already been sent."""
-        key = self._paper_key(paper_id)
-        return key in self._sent_papers
+        data = self._sent_papers.get(self._paper_key(paper_id))
+        return data is not None and data["sent_at_ts"] >= time.time() - self._sent_expiry_s
 
     def mark_paper_sent(
         self,
@@ -188,19 +290,55 @@ class CacheManager:
         doi: str = "",
         source_symbol: str = "",
         citation_label: str = "",
+        sent_at: Optional[str] = None,
     ) -> None:
         """Mark paper as sent."""
         key = self._paper_key(paper_id)
+        sent_at = sent_at or datetime.now().isoformat()
         self._sent_papers[key] = {
             "paper_id": paper_id,
             "doi": doi,
             "title": title,
-            "source": source,
-            "source_symbol": source_symbol,
-            "sent_at": datetime.now().isoformat(),
+            "source": sys.intern(source),
+            "source_symbol": sys.intern(source_symbol),
+            "sent_at": sent_at,
+            "sent_at_day": sent_at[:10],
+            "sent_at_ts": datetime.fromisoformat(sent_at).timestamp(),
             "citation_label": citation_label,
         }
+        self._dirty_papers.add(key)
+
+    def mark_papers_sent_bulk(self, rows: Iterable[Dict[str, str]]) -> int:
+        """
+        Mark many papers as sent with a shared timestamp.
+
+        Nothing is written until save(), so the whole batch reaches the
+        external store in a single upload.
+
+        Args:
+            rows: Keyword arguments for mark_paper_sent(), one dict per paper
+
+        Returns:
+            Number of papers marked
+        """
+        sent_at = datetime.now().isoformat()
+        count = 0
+        for row in rows:
+            self.mark_paper_sent(**row, sent_at=sent_at)
+            count += 1
+        return count
+
+    def sent_id_set(self) -> Set[str]:
+        """Return a snapshot of the IDs of all sent papers."""
+        cutoff = time.time() - self._sent_expiry_s
+        return {key for key, data in self._sent_papers.items() if data["sent_at_ts"] >= cutoff}
 
     def get_unsent_papers(self, papers: list) -> list:
-        """Filter out already-sent papers."""
-        return [p for p in papers if not self.is_paper_sent(p.id)]
+        """
+        Filter out already-sent papers.
+
+        The expiry cutoff is applied once while building the sent-ID set,
+        leaving one hash probe per paper.
+        """
+        sent = self.sent_id_set()
+        return [p for p in papers if self._paper_key(p.id) not in sent]
@@ -1,200 +1,71 @@
 """Email sending service for paper notifications."""
 
+import io
 import logging
 import smtplib
+import threading
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from typing import Any, Dict, List
+from html import escape
+from types import MappingProxyType
+from typing import Any, Dict, List, Tuple
 
 from ..models import Paper
 from .mathml import convert_latex_to_mathml
 
 logger = logging.getLogger(__name__)
 
-
-class EmailSender:
-    """
-    Sends email notifications for papers.
-
-    Features:
-    - Batch mode: one email per source with all papers grouped together
-    - HTML email with MathML support and card-based layout
-    - Plain text fallback
-    - はてなブックマーク「あとで読む」integration
-    """
-
-    REPO_URL = "https://github.com/kmitsutani/article-checker"
-
-    def __init__(self, config: Dict[str, Any]):
-        """
-        Initialize email sender.
-
-        Args:
-            config: Email configuration dict with smtp and email settings
-        """
-        self.smtp_config = config.get("smtp", {})
-        self.email_config = config.get("email", {})
-
-    def send_paper(self, paper: Paper) -> bool:
-        """
-        Send email for a single paper (backward compatible).
-
-        Delegates to send_batch() with a single-paper list.
-
-        Args:
-            paper: Paper to send
-
-        Returns:
-            True if sent successfully
-        """
-        return self.send_batch(
-            paper.source,
-            paper.source_symbol or paper.source,
-            [paper],
-        )
-
-    def send_batch(self, source: str, source_symbol: str, papers: List[Paper]) -> bool:
-        """
-        Send a single email containing all papers for a given source.
-
-        Args:
-            source: Source name (e.g., "arXiv:hep-th", "PRX Quantum")
-            source_symbol: Short symbol for subject (e.g., "arxiv/hep-th", "PRX-Q")
-            papers: List of papers to include
-
-        Returns:
-            True if sent successfully
-        """
-        if not papers:
-            return True
-
-        subject = self._build_batch_subject(source_symbol, papers)
-        plain_body = self._build_batch_plain_body(source, papers)
-        html_body = self._build_batch_html_body(source, source_symbol, papers)
-
-        return self._send_email(subject, plain_body, html_body)
-
-    @staticmethod
-    def build_citation_label(paper: Paper) -> str:
-        """Build a short citation label like 'Smith+24_Title' or 'Smith-Jones-Lee_Title'."""
-        title = paper.title.replace(" ", "")
-        yy = paper.published.strftime("%y") if paper.published else ""
-        if not paper.authors:
-            return title
-        if len(paper.authors) > 3:
-            return f"{paper.authors[0].name.lastname}+{yy}_{title}"
-        return "-".join(a.name.lastname for a in paper.authors) + f"_{title}"
-
-    # ── Batch subject / plain / html ──────────────────────────────
-
-    @staticmethod
-    def _build_batch_subject(source_symbol: str, papers: List[Paper]) -> str:
-        """Build subject line for a batch email."""
-        n = len(papers)
-        return f"[{source_symbol}] {n} new paper{'s' if n != 1 else ''}"
-
-    def _build_batch_plain_body(self, source: str, papers: List[Paper]) -> str:
-        """Build plain text body listing all papers."""
-        lines = [
-            f"[{self.REPO_URL}]",
-            "",
-            f"Source: {source}",
-            f"Papers: {len(papers)}",
-            "",
-            "=" * 60,
-        ]
-
-        for i, paper in enumerate(papers, 1):
-            citation_label = self.build_citation_label(paper)
-            lines.append("")
-            lines.append(f"[{i}/{len(papers)}] {paper.title}")
-            lines.append(f"  Citation: {citation_label}")
-            lines.append(f"  URL: {paper.url}")
-
-            if paper.authors:
-                author_names = ", ".join(a.name.fullname for a in paper.authors)
-                lines.append(f"  Authors: {author_names}")
-
-            if paper.keywords_matched:
-                lines.append(f"  Keywords: {', '.join(paper.keywords_matched)}")
-
-            if paper.score_class == "score-journal":
-                lines.append(f"  {paper.score_label}")
-            elif paper.max_h_index > 0:
-                lines.append(f"  Max h-index: {paper.max_h_index} ({paper.score_label})")
-
-            hatena_url = (
-                "https://b.hatena.ne.jp/my/add.confirm?url="
-                + urllib.parse.quote(paper.url, safe="")
-            )
-            lines.append(f"  あとで読む: {hatena_url}")
-
-            lines.append("")
-            lines.append("  Abstract:")
-            lines.append(f"  {paper.abstract}")
-            lines.append("")
-            lines.append("-" * 60)
-
-        return "\n".join(lines)
-
-    def _build_batch_html_body(
-        self, source: str, source_symbol: str, papers: List[Paper]
-    ) -> str:
-        """Build HTML email body with card layout for all papers."""
-        cards_html = "\n".join(
-            self._render_paper_card(paper, i, len(papers))
-            for i, paper in enumerate(papers, 1)
-        )
-
-        html = f"""<!DOCTYPE html>
+# Static document head; plain string so the CSS needs no brace escaping
+_HTML_HEAD = """<!DOCTYPE html>
 <html lang="ja">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <style>
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Arial, sans-serif;
             line-height: 1.6;
             max-width: 800px;
             margin: 0 auto;
             padding: 20px;
             background-color: #f5f5f5;
-        }}
-        .header {{
+        }
+        .header {
             background-color: #2c3e50;
             color: white;
             padding: 20px 25px;
             border-radius: 8px 8px 0 0;
-        }}
-        .header h1 {{
+        }
+        .header h1 {
             margin: 0;
             font-size: 1.3em;
-        }}
-        .header .meta {{
+        }
+        .header .meta {
             color: #bdc3c7;
             font-size: 0.85em;
             margin-top: 5px;
-        }}
-        .header .meta a {{
+        }
+        .header .meta a {
             color: #bdc3c7;
-        }}
-        .paper-card {{
+        }
+        .paper-card {
             background-color: white;
             padding: 20px 25px;
             border-bottom: 1px solid #ecf0f1;
-        }}
-        .paper-card:last-child {{
+        }
+        .paper-card:last-child {
             border-bottom: none;
             border-radius: 0 0 8px 8px;
-        }}
-        .paper-card h2 {{
+        }
+        .paper-card h2 {
             color: #2c3e50;
             font-size: 1.15em;
             margin: 0 0 8px 0;
-        }}
-        .paper-number {{
+        }
+        .paper-number {
             display: inline-block;
             background-color: #3498db;
             color: white;
@@ -206,33 +77,33 @@ class EmailSender:
             font-size: 0.8em;
             margin-right: 8px;
             vertical-align: middle;
-        }}
-        .source-badge {{
+        }
+        .source-badge {
             display: inline-block;
             background-color: #3498db;
             color: white;
             padding: 3px 10px;
             border-radius: 12px;
             font-size: 0.85em;
-        }}
-        .score-badge {{
+        }
+        .score-badge {
             display: inline-block;
             padding: 3px 12px;
             border-radius: 15px;
             font-weight: bold;
             font-size: 0.85em;
             margin: 5px 0;
-        }}
-        .card-meta {{
+        }
+        .card-meta {
             color: #7f8c8d;
             font-size: 0.9em;
             margin: 5px 0;
-        }}
-        .keywords {{
+        }
+        .keywords {
             color: #e74c3c;
             font-weight: 500;
-        }}
-        .abstract {{
+        }
+        .abstract {
             background-color: #f9f9f9;
             border-left: 3px solid #95a5a6;
             padding: 12px 15px;
@@ -240,11 +111,11 @@ class EmailSender:
             font-style: italic;
             color: #555;
             font-size: 0.9em;
-        }}
-        .buttons {{
+        }
+        .buttons {
             margin-top: 12px;
-        }}
-        .btn {{
+        }
+        .btn {
             display: inline-block;
             padding: 8px 16px;
             border-radius: 5px;
@@ -253,124 +124,332 @@ class EmailSender:
             font-size: 0.85em;
             margin-right: 8px;
             margin-bottom: 5px;
-        }}
-        .btn-read {{
+        }
+        .btn-read {
             background-color: #3498db;
             color: white;
-        }}
-        .btn-pdf {{
+        }
+        .btn-pdf {
             background-color: #27ae60;
             color: white;
-        }}
-        .btn-hatena {{
+        }
+        .btn-hatena {
             background-color: #00A4DE;
             color: white;
-        }}
-        .authors-table {{
+        }
+        .authors-table {
             width: 100%;
             border-collapse: collapse;
             margin: 10px 0;
             font-size: 0.85em;
-        }}
-        .authors-table th {{
+        }
+        .authors-table th {
             background-color: #3498db;
             color: white;
             padding: 6px 8px;
             text-align: left;
-        }}
-        .authors-table td {{
+        }
+        .authors-table td {
             padding: 6px 8px;
             border-bottom: 1px solid #eee;
-        }}
+        }
     </style>
 </head>
 <body>
-    <div class="header">
-        <h1>[{source_symbol}] {len(papers)} new paper{"s" if len(papers) != 1 else ""}</h1>
+"""
+
+# (background, foreground) of the score badge per score class
+_SCORE_COLORS = MappingProxyType({
+    "score-s-plus": ("#ffd700", "#000"),
+    "score-s": ("#ff6b6b", "white"),
+    "score-a": ("#4ecdc4", "white"),
+    "score-b": ("#45b7d1", "white"),
+    "score-c": ("#95a5a6", "white"),
+    "score-journal": ("#2ecc71", "white"),
+})
+_DEFAULT_SCORE_COLORS = ("#95a5a6", "white")
+
+# Score classes whose badge label omits the h-index
+_SCORE_CLASSES_WITHOUT_H_INDEX = frozenset({"score-journal"})
+
+# はてなブックマーク add page; the URL-quoted paper URL is appended
+_HATENA_ADD_URL = "https://b.hatena.ne.jp/my/add.confirm?url="
+
+
+class EmailSender:
+    """
+    Sends email notifications for papers.
+
+    Features:
+    - Batch mode: one email per source with all papers grouped together
+    - HTML email with MathML support and card-based layout
+    - Plain text fallback
+    - はてなブックマーク「あとで読む」integration
+    """
+
+    REPO_URL = "https://github.com/kmitsutani/article-checker"
+    MAX_WORKERS = 4  # concurrent SMTP sessions in send_all (Gmail limits these)
+
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Initialize email sender.
+
+        Args:
+            config: Email configuration dict with smtp and email settings
+        """
+        self.smtp_config = config.get("smtp", {})
+        self.email_config = config.get("email", {})
+
+        # Inside a `with` block each thread opens one SMTP session on its
+        # first send and reuses it for later ones; otherwise each email
+        # gets its own connection
+        self._local = threading.local()
+        self._sessions: List[smtplib.SMTP] = []
+        self._sessions_lock = threading.Lock()
+        self._keep_open = False
+
+    def __enter__(self) -> "EmailSender":
+        self._keep_open = True
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._keep_open = False
+        self.close()
+
+    def close(self) -> None:
+        """Close all reused SMTP sessions."""
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+            self._local = threading.local()
+        for server in sessions:
+            try:
+                server.quit()
+            except smtplib.SMTPException as e:
+                logger.debug(f"Error closing SMTP session: {e}")
+
+    def send_paper(self, paper: Paper) -> bool:
+        """
+        Send email for a single paper (backward compatible).
+
+        Delegates to send_batch() with a single-paper list.
+
+        Args:
+            paper: Paper to send
+
+        Returns:
+            True if sent successfully
+        """
+        return self.send_batch(
+            paper.source,
+            paper.source_symbol or paper.source,
+            [paper],
+        )
+
+    def send_batch(self, source: str, source_symbol: str, papers: List[Paper]) -> bool:
+        """
+        Send a single email containing all papers for a given source.
+
+        Args:
+            source: Source name (e.g., "arXiv:hep-th", "PRX Quantum")
+            source_symbol: Short symbol for subject (e.g., "arxiv/hep-th", "PRX-Q")
+            papers: List of papers to include
+
+        Returns:
+            True if sent successfully
+        """
+        if not papers:
+            return True
+
+        # Labels and bookmark links appear in both the plain and HTML bodies
+        labels = [self.build_citation_label(p) for p in papers]
+        hatena_urls = [_HATENA_ADD_URL + urllib.parse.quote(p.url, safe="") for p in papers]
+
+        subject = self._build_batch_subject(source_symbol, papers)
+        plain_body = self._build_batch_plain_body(source, papers, labels, hatena_urls)
+        html_body = self._build_batch_html_body(
+            source, source_symbol, papers, labels, hatena_urls
+        )
+
+        return self._send_email(subject, plain_body, html_body)
+
+    def send_all(self, batches: List[Tuple[str, str, List[Paper]]]) -> List[bool]:
+        """
+        Send several batch emails concurrently, one SMTP session per worker.
+
+        Args:
+            batches: (source, source_symbol, papers) per email, as for send_batch()
+
+        Returns:
+            Success flag per batch, in input order
+        """
+        if not batches:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, len(batches))) as ex:
+            return list(ex.map(lambda batch: self.send_batch(*batch), batches))
+
+    @staticmethod
+    def build_citation_label(paper: Paper) -> str:
+        """Build a short citation label like 'Smith+24_Title' or 'Smith-Jones-Lee_Title'."""
+        title = paper.title.replace(" ", "")
+        yy = f"{paper.published.year % 100:02d}" if paper.published else ""
+        if not paper.authors:
+            return title
+        if len(paper.authors) > 3:
+            return f"{paper.authors[0].name.lastname}+{yy}_{title}"
+        return "-".join(a.name.lastname for a in paper.authors) + f"_{title}"
+
+    # ── Batch subject / plain / html ──────────────────────────────
+
+    @staticmethod
+    def _build_batch_subject(source_symbol: str, papers: List[Paper]) -> str:
+        """Build subject line for a batch email."""
+        n = len(papers)
+        return f"[{source_symbol}] {n} new paper{'s' if n != 1 else ''}"
+
+    def _build_batch_plain_body(
+        self,
+        source: str,
+        papers: List[Paper],
+        labels: List[str],
+        hatena_urls: List[str],
+    ) -> str:
+        """Build plain text body listing all papers."""
+        n = len(papers)
+        buf = io.StringIO()
+        w = buf.write
+        # Every line after the header is written as "\n" + line, so the body
+        # ends without a trailing newline
+        w(f"[{self.REPO_URL}]\n\nSource: {source}\nPapers: {n}\n\n" + "=" * 60)
+
+        for i, (paper, citation_label, hatena_url) in enumerate(
+            zip(papers, labels, hatena_urls), 1
+        ):
+            authors, keywords, max_h = paper.authors, paper.keywords_matched, paper.max_h_index
+            w(
+                f"\n\n[{i}/{n}] {paper.title}"
+                f"\n  Citation: {citation_label}"
+                f"\n  URL: {paper.url}"
+            )
+
+            if authors:
+                w("\n  Authors: " + ", ".join(a.name.fullname for a in authors))
+
+            if keywords:
+                w("\n  Keywords: " + ", ".join(keywords))
+
+            if paper.score_class == "score-journal":
+                w(f"\n  {paper.score_label}")
+            elif max_h > 0:
+                w(f"\n  Max h-index: {max_h} ({paper.score_label})")
+
+            w(f"\n  あとで読む: {hatena_url}")
+            w(f"\n\n  Abstract:\n  {paper.abstract}\n\n" + "-" * 60)
+
+        return buf.getvalue()
+
+    def _build_batch_html_body(
+        self,
+        source: str,
+        source_symbol: str,
+        papers: List[Paper],
+        labels: List[str],
+        hatena_urls: List[str],
+    ) -> str:
+        """Build HTML email body with card layout for all papers."""
+        n = len(papers)
+        header = f"""    <div class="header">
+        <h1>[{escape(source_symbol)}] {n} new paper{"s" if n != 1 else ""}</h1>
         <div class="meta">
-            Source: {source} |
+            Source: {escape(source)} |
             <a href="{self.REPO_URL}">{self.REPO_URL}</a>
         </div>
     </div>
-{cards_html}
-</body>
-</html>
 """
-        return html
 
-    def _render_paper_card(self, paper: Paper, index: int, total: int) -> str:
-        """Render a single paper card as HTML."""
+        # Cards contribute their fragments directly; the document is joined once
+        parts = [_HTML_HEAD, header]
+        for i, (paper, label, hatena_url) in enumerate(zip(papers, labels, hatena_urls), 1):
+            if i > 1:
+                parts.append("\n")
+            parts.extend(self._render_paper_card(paper, i, n, label, hatena_url))
+        parts.append("\n</body>\n</html>\n")
+        return "".join(parts)
+
+    def _render_paper_card(
+        self,
+        paper: Paper,
+        index: int,
+        total: int,
+        citation_label: str,
+        hatena_url: str,
+    ) -> List[str]:
+        """Render a single paper card as a list of HTML fragments."""
         abstract_html = convert_latex_to_mathml(paper.abstract)
-        citation_label = self.build_citation_label(paper)
-
-        # Score badge
-        score_colors = {
-            "score-s-plus": ("#ffd700", "#000"),
-            "score-s": ("#ff6b6b", "white"),
-            "score-a": ("#4ecdc4", "white"),
-            "score-b": ("#45b7d1", "white"),
-            "score-c": ("#95a5a6", "white"),
-            "score-journal": ("#2ecc71", "white"),
-        }
-        bg, fg = score_colors.get(paper.score_class, ("#95a5a6", "white"))
 
-        card = f"""    <div class="paper-card">
-        <h2><span class="paper-number">{index}</span>{paper.get_score_emoji()} {paper.title}</h2>
-        <div class="card-meta">{citation_label}</div>
-"""
+        parts = [f"""    <div class="paper-card">
+        <h2><span class="paper-number">{index}</span>{paper.get_score_emoji()} {escape(paper.title)}</h2>
+        <div class="card-meta">{escape(citation_label)}</div>
+"""]
 
         # Authors
         if paper.authors:
-            author_names = ", ".join(a.name.fullname for a in paper.authors)
-            card += f'        <div class="card-meta">Authors: {author_names}</div>\n'
+            author_names = ", ".join(escape(a.name.fullname) for a in paper.authors)
+            parts.append(f'        <div class="card-meta">Authors: {author_names}</div>\n')
 
         # Score badge
-        if paper.score_class:
-            if paper.score_class == "score-journal":
-                label = paper.score_label
-            elif paper.max_h_index > 0:
-                label = f"h-index: {paper.max_h_index} ({paper.score_label})"
-            else:
-                label = paper.score_label
-            card += f'        <div class="score-badge" style="background-color: {bg}; color: {fg};">{label}</div>\n'
+        score_class = paper.score_class
+        if score_class:
+            bg, fg = _SCORE_COLORS.get(score_class, _DEFAULT_SCORE_COLORS)
+            label = paper.score_label
+            if paper.max_h_index > 0 and score_class not in _SCORE_CLASSES_WITHOUT_H_INDEX:
+                label = f"h-index: {paper.max_h_index} ({label})"
+            parts.append(f'        <div class="score-badge" style="background-color: {bg}; color: {fg};">{label}</div>\n')
 
         # Keywords
         if paper.keywords_matched:
-            card += f'        <div class="card-meta"><span class="keywords">Keywords: {" &bull; ".join(paper.keywords_matched)}</span></div>\n'
+            parts.append(f'        <div class="card-meta"><span class="keywords">Keywords: {" &bull; ".join(escape(k) for k in paper.keywords_matched)}</span></div>\n')
 
         # Published date
         if paper.published:
-            card += f'        <div class="card-meta">Published: {paper.published.strftime("%Y-%m-%d %H:%M")}</div>\n'
+            dt = paper.published
+            parts.append(
+                f'        <div class="card-meta">Published: '
+                f'{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}</div>\n'
+            )
 
         # Authors table (Semantic Scholar data)
-        if paper.authors and any(a.h_index is not None for a in paper.authors):
-            card += '        <table class="authors-table">\n'
-            card += "            <tr><th>Author</th><th>h-index</th><th>Citations</th><th>Papers</th></tr>\n"
-            for author in paper.authors:
-                if author.h_index is not None:
-                    url = author.semantic_scholar_url or "#"
-                    citations = f"{author.citation_count:,}" if author.citation_count else "-"
-                    p_count = author.paper_count if author.paper_count else "-"
-                    card += f'            <tr><td><a href="{url}">{author.name.fullname}</a></td><td>{author.h_index}</td><td>{citations}</td><td>{p_count}</td></tr>\n'
-            card += "        </table>\n"
+        scored = [a for a in paper.authors if a.h_index is not None]
+        if scored:
+            parts.append('        <table class="authors-table">\n')
+            parts.append("            <tr><th>Author</th><th>h-index</th><th>Citations</th><th>Papers</th></tr>\n")
+            append = parts.append
+            for author in scored:
+                h_index, url, cites, p_count = (
+                    author.h_index,
+                    author.semantic_scholar_url,
+                    author.citation_count,
+                    author.paper_count,
+                )
+                url = escape(url or "#")
+                name = escape(author.name.fullname)
+                citations = format(cites, ",") if cites else "-"
+                p_count = p_count if p_count else "-"
+                append(f'            <tr><td><a href="{url}">{name}</a></td><td>{h_index}</td><td>{citations}</td><td>{p_count}</td></tr>\n')
+            parts.append("        </table>\n")
 
         # Abstract
-        card += f'        <div class="abstract">{abstract_html}</div>\n'
+        parts.append(f'        <div class="abstract">{abstract_html}</div>\n')
 
         # Buttons
-        hatena_url = (
-            "https://b.hatena.ne.jp/my/add.confirm?url="
-            + urllib.parse.quote(paper.url, safe="")
-        )
-        card += '        <div class="buttons">\n'
-        card += f'            <a href="{paper.url}" class="btn btn-read" target="_blank">Read Paper &rarr;</a>\n'
+        parts.append('        <div class="buttons">\n')
+        parts.append(f'            <a href="{escape(paper.url)}" class="btn btn-read" target="_blank">Read Paper &rarr;</a>\n')
         if paper.pdf_url:
-            card += f'            <a href="{paper.pdf_url}" class="btn btn-pdf" target="_blank">Download PDF</a>\n'
-        card += f'            <a href="{hatena_url}" class="btn btn-hatena" target="_blank">あとで読む</a>\n'
-        card += "        </div>\n"
-        card += "    </div>"
+            parts.append(f'            <a href="{escape(paper.pdf_url)}" class="btn btn-pdf" target="_blank">Download PDF</a>\n')
+        parts.append(f'            <a href="{escape(hatena_url)}" class="btn btn-hatena" target="_blank">あとで読む</a>\n')
+        parts.append("        </div>\n")
+        parts.append("    </div>")
 
-        return card
+        return parts
 
     def _send_email(self, subject: str, plain_body: str, html_body: str) -> bool:
         """Send email via SMTP."""
@@ -385,26 +464,7 @@ class EmailSender:
             msg.attach(MIMEText(plain_body, "plain", "utf-8"))
             msg.attach(MIMEText(html_body, "html", "utf-8"))
 
-            # Connect and send
-            server_host = self.smtp_config.get("server", "smtp.gmail.com")
-            server_port = self.smtp_config.get("port", 587)
-            use_ssl = self.smtp_config.get("use_ssl", False)
-            use_tls = self.smtp_config.get("use_tls", True)
-
-            if use_ssl:
-                server = smtplib.SMTP_SSL(server_host, server_port)
-            else:
-                server = smtplib.SMTP(server_host, server_port)
-                if use_tls:
-                    server.starttls()
-
-            username = self.smtp_config.get("username", "")
-            password = self.smtp_config.get("password", "")
-            if username and password:
-                server.login(username, password)
-
-            server.send_message(msg)
-            server.quit()
+            self._deliver(msg)
 
             logger.info(f"Email sent: {subject[:50]}...")
             return True
@@ -412,3 +472,49 @@ class EmailSender:
         except Exception as e:
             logger.error(f"Failed to send email: {e}")
             return False
+
+    def _deliver(self, msg: MIMEMultipart) -> None:
+        """Send a message, reusing this thread's open SMTP session if any."""
+        server = getattr(self._local, "server", None)
+        if server is not None:
+            try:
+                server.send_message(msg)
+                return
+            except smtplib.SMTPServerDisconnected:
+                # Server dropped the idle session; reconnect once below
+                logger.info("SMTP session closed by server, reconnecting")
+                self._local.server = None
+
+        server = self._connect()
+        try:
+            server.send_message(msg)
+        except Exception:
+            server.close()
+            raise
+        if self._keep_open:
+            self._local.server = server
+            with self._sessions_lock:
+                self._sessions.append(server)
+        else:
+            server.quit()
+
+    def _connect(self) -> smtplib.SMTP:
+        """Open and authenticate an SMTP session."""
+        server_host = self.smtp_config.get("server", "smtp.gmail.com")
+        server_port = self.smtp_config.get("port", 587)
+        use_ssl = self.smtp_config.get("use_ssl", False)
+        use_tls = self.smtp_config.get("use_tls", True)
+
+        if use_ssl:
+            server = smtplib.SMTP_SSL(server_host, server_port)
+        else:
+            server = smtplib.SMTP(server_host, server_port)
+            if use_tls:
+                server.starttls()
+
+        username = self.smtp_config.get("username", "")
+        password = self.smtp_config.get("password", "")
+        if username and password:
+            server.login(username, password)
+
+        return server
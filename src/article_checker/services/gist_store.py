@@ -4,10 +4,13 @@ import csv
 import hashlib
 import io
 import logging
+from operator import itemgetter
 from typing import Any, Dict, List
 
 import requests
 
+from .. import _json
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,6 +35,7 @@ class GistStore:
         self.gist_id = gist_id
         self.filename = filename
         self.columns = columns
+        self._cols_tuple = tuple(columns)
         self.session = requests.Session()
         self.session.headers.update(
             {
@@ -44,7 +48,8 @@ class GistStore:
     def _key_for(self, row: dict) -> str:
         """Generate a stable dict key from the first column value."""
         value = row.get(self.columns[0], "")
-        return hashlib.md5(value.encode()).hexdigest()
+        # Non-cryptographic use; lets FIPS-mode OpenSSL builds allow md5
+        return hashlib.md5(value.encode(), usedforsecurity=False).hexdigest()
 
     def load(self) -> Dict[str, Any]:
         """Download CSV from Gist and return as {md5_key: row_dict}."""
@@ -53,7 +58,8 @@ class GistStore:
                 f"{self.GIST_API}/{self.gist_id}", timeout=30
             )
             resp.raise_for_status()
-            files = resp.json().get("files", {})
+            payload = _json.loads(resp.content)
+            files = payload.get("files", {})
 
             if self.filename not in files:
                 logger.info(f"No {self.filename} in Gist, starting fresh")
@@ -63,34 +69,62 @@ class GistStore:
             if not content.strip():
                 return {}
 
-            reader = csv.DictReader(io.StringIO(content))
-            result: Dict[str, Any] = {}
-            for row in reader:
-                key = self._key_for(row)
-                result[key] = {col: row.get(col, "") for col in self.columns}
+            result = self._parse_csv(content)
             logger.info(f"Loaded {len(result)} rows from Gist/{self.filename}")
             return result
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             logger.error(f"Failed to load {self.filename} from Gist: {e}")
             return {}
 
+    def _parse_csv(self, content: str) -> Dict[str, Any]:
+        """Parse CSV text into {md5_key: row_dict} over the configured columns.
+
+        Columns are matched by header name, so files written before a column
+        was added still load (missing values become "").
+        """
+        reader = csv.reader(io.StringIO(content))
+        header = next(reader, [])
+        positions = {name: i for i, name in enumerate(header)}
+        indices = [positions.get(col) for col in self._cols_tuple]
+        n = len(indices)
+        # Header starts with exactly our columns: rows zip straight into dicts
+        in_order = indices == list(range(n))
+
+        result: Dict[str, Any] = {}
+        for values in reader:
+            if not values:
+                continue
+            if in_order and len(values) >= n:
+                row = dict(zip(self._cols_tuple, values))
+            else:
+                row = {
+                    col: values[i] if i is not None and i < len(values) else ""
+                    for col, i in zip(self._cols_tuple, indices)
+                }
+            result[self._key_for(row)] = row
+        return result
+
     def save(self, data: Dict[str, Any]) -> None:
         """Serialize dict to CSV and upload to Gist."""
         output = io.StringIO()
-        writer = csv.DictWriter(
-            output, fieldnames=self.columns, extrasaction="ignore"
-        )
-        writer.writeheader()
+        writer = csv.writer(output)
+        writer.writerow(self._cols_tuple)
 
-        rows = sorted(data.values(), key=lambda r: r.get(self.columns[-1], ""))
-        for row in rows:
-            writer.writerow({col: row.get(col, "") for col in self.columns})
+        rows = list(data.values())
+        try:
+            rows.sort(key=itemgetter(self.columns[-1]))
+        except KeyError:
+            rows.sort(key=lambda r: r.get(self.columns[-1], ""))
+        writer.writerows([row.get(col, "") for col in self._cols_tuple] for row in rows)
 
+        body = {"files": {self.filename: {"content": output.getvalue()}}}
+        output.close()
         try:
             resp = self.session.patch(
                 f"{self.GIST_API}/{self.gist_id}",
-                json={"files": {self.filename: {"content": output.getvalue()}}},
+                data=_json.dumps(body),
+                headers={"Content-Type": "application/json"},
                 timeout=30,
             )
             resp.raise_for_status()
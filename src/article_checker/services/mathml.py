@@ -2,6 +2,7 @@
 
 import re
 import logging
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
@@ -9,11 +10,18 @@ logger = logging.getLogger(__name__)
 try:
     from latex2mathml.converter import convert as latex_to_mathml
 
+    # Conversion is pure and slow, and fragments recur across abstracts
+    _cached_convert = lru_cache(maxsize=4096)(latex_to_mathml)
+
     MATHML_AVAILABLE = True
 except ImportError:
     MATHML_AVAILABLE = False
     logger.warning("latex2mathml not installed. Math rendering will use fallback.")
 
+# Display math ($$...$$) must be matched before inline math ($...$)
+_DISPLAY_MATH_RE = re.compile(r"\$\$(.*?)\$\$", re.DOTALL)
+_INLINE_MATH_RE = re.compile(r"\$(.*?)\$")
+
 
 def convert_latex_to_mathml(text: str) -> str:
     """
@@ -29,13 +37,15 @@ def convert_latex_to_mathml(text: str) -> str:
     Returns:
         Text with LaTeX converted to MathML
     """
+    if "$" not in text:
+        return text
     if not MATHML_AVAILABLE:
         return _fallback_convert(text)
 
     def replace_display_math(match: re.Match) -> str:
         latex = match.group(1).strip()
         try:
-            mathml = latex_to_mathml(latex)
+            mathml = _cached_convert(latex)
             return f'<div style="text-align: center; margin: 1em 0;">{mathml}</div>'
         except Exception as e:
             logger.debug(f"Failed to convert display math: {latex[:50]}... Error: {e}")
@@ -44,17 +54,17 @@ def convert_latex_to_mathml(text: str) -> str:
     def replace_inline_math(match: re.Match) -> str:
         latex = match.group(1).strip()
         try:
-            mathml = latex_to_mathml(latex)
+            mathml = _cached_convert(latex)
             return mathml
         except Exception as e:
             logger.debug(f"Failed to convert inline math: {latex[:50]}... Error: {e}")
             return f"<code>{latex}</code>"
 
     # Process display math first ($$...$$)
-    text = re.sub(r"\$\$(.*?)\$\$", replace_display_math, text, flags=re.DOTALL)
+    text = _DISPLAY_MATH_RE.sub(replace_display_math, text)
 
     # Then process inline math ($...$)
-    text = re.sub(r"\$(.*?)\$", replace_inline_math, text)
+    text = _INLINE_MATH_RE.sub(replace_inline_math, text)
 
     return text
 
@@ -65,6 +75,8 @@ def _fallback_convert(text: str) -> str:
 
     Simply wraps LaTeX in <code> tags for display.
     """
+    if "$" not in text:
+        return text
 
     def replace_display(match: re.Match) -> str:
         latex = match.group(1).strip()
@@ -74,7 +86,7 @@ def _fallback_convert(text: str) -> str:
         latex = match.group(1).strip()
         return f"<code>{latex}</code>"
 
-    text = re.sub(r"\$\$(.*?)\$\$", replace_display, text, flags=re.DOTALL)
-    text = re.sub(r"\$(.*?)\$", replace_inline, text)
+    text = _DISPLAY_MATH_RE.sub(replace_display, text)
+    text = _INLINE_MATH_RE.sub(replace_inline, text)
 
     return text
@@ -3,5 +3,7 @@
 from .base import BaseSource
 from .arxiv import ArxivSource
 from .journal import JournalSource
+from .feed_cache import FeedCache
+from .parallel import fetch_many
 
-__all__ = ["BaseSource", "ArxivSource", "JournalSource"]
+__all__ = ["BaseSource", "ArxivSource", "JournalSource", "FeedCache", "fetch_many"]
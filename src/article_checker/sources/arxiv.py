@@ -4,15 +4,25 @@ import re
 import time
 import logging
 from datetime import datetime
-from typing import List, Dict, Any, Optional
-
-import feedparser
+from itertools import islice
+from typing import List, Dict, Any, Optional, Tuple
 
 from .base import BaseSource
+from .feed_cache import FeedCache
 from ..models import Paper, Author, parse_author_name
 
 logger = logging.getLogger(__name__)
 
+_ARXIV_ID_RE = re.compile(r"arxiv\.org/abs/(\d{4}\.\d{4,5}(?:v\d+)?)")
+
+# Fallback date formats for strings the ISO and RFC 822 parsers reject
+_DATE_FORMATS = (
+    "%a, %d %b %Y %H:%M:%S %Z",
+    "%Y-%m-%dT%H:%M:%S%z",
+    "%Y-%m-%dT%H:%M:%SZ",
+    "%Y-%m-%d",
+)
+
 
 class ArxivSource(BaseSource):
     """
@@ -23,37 +33,38 @@ class ArxivSource(BaseSource):
     - IDs are in format http://arxiv.org/abs/XXXX.XXXXX
     """
 
+    def __init__(self, config: Dict[str, Any], feed_cache: Optional[FeedCache] = None):
+        super().__init__(config, feed_cache)
+        # Source labels are the same for every entry; resolve them once here
+        category = config.get("category", "unknown")
+        self._source_label = f"arXiv:{category}"
+        self._source_symbol = config.get("symbol", f"arxiv/{category}")
+
     def fetch(self) -> List[Paper]:
         """Fetch and filter papers from arXiv RSS feed."""
         papers = []
         url = self.config["url"]
-        category = self.config.get("category", "unknown")
 
         logger.info(f"Fetching arXiv feed: {url}")
-        feed = feedparser.parse(url)
+        feed = self._fetch_feed(url)
 
         if feed.bozo:
             logger.warning(f"Feed parsing warning for {url}: {feed.bozo_exception}")
 
-        filters = self.config.get("filters", {})
-        keyword_config = filters.get("keywords", {})
-        include_keywords = keyword_config.get("include", [])
-        exclude_keywords = keyword_config.get("exclude", [])
-
-        for entry in feed.entries:
+        # Optional per-feed cap; feeds list the newest entries first
+        for entry in islice(feed.entries, self._max_entries):
             try:
-                paper = self._parse_entry(entry)
-                paper.source = f"arXiv:{category}"
-                paper.source_symbol = self.config.get("symbol", f"arxiv/{category}")
-
-                # Apply keyword filter if enabled
-                if keyword_config.get("enabled", False):
-                    text = f"{paper.title} {paper.abstract}"
-                    passes, matched = self._apply_keyword_filter(
-                        text, include_keywords, exclude_keywords
-                    )
+                # Apply keyword filter if enabled, before the full parse so
+                # rejected entries skip author and date parsing
+                text_fields = None
+                if self._keyword_filter_enabled:
+                    text_fields = self._title_and_abstract(entry)
+                    passes, matched = self._apply_keyword_filter(" ".join(text_fields))
                     if not passes:
                         continue
+
+                paper = self._parse_entry(entry, text_fields)
+                if self._keyword_filter_enabled:
                     paper.keywords_matched = matched
 
                 papers.append(paper)
@@ -62,10 +73,12 @@ class ArxivSource(BaseSource):
                 logger.warning(f"Failed to parse entry: {e}")
                 continue
 
-        logger.info(f"Found {len(papers)} papers from arXiv:{category}")
+        logger.info(f"Found {len(papers)} papers from {self._source_label}")
         return papers
 
-    def _parse_entry(self, entry: Any) -> Paper:
+    def _parse_entry(
+        self, entry: Any, title_and_abstract: Optional[Tuple[str, str]] = None
+    ) -> Paper:
         """Parse an arXiv RSS entry into a Paper object."""
         # Extract arXiv ID from URL
         arxiv_id = self._extract_arxiv_id(entry.get("id", ""))
@@ -76,12 +89,15 @@ class ArxivSource(BaseSource):
         # Parse publication date
         published = self._parse_date(entry)
 
+        title, abstract = title_and_abstract or self._title_and_abstract(entry)
+
         return Paper(
             id=entry.get("id", ""),
-            title=self._clean_title(entry.get("title", "")),
+            title=title,
             url=entry.get("link", entry.get("id", "")),
-            source="arXiv",
-            abstract=entry.get("summary", ""),
+            source=self._source_label,
+            source_symbol=self._source_symbol,
+            abstract=abstract,
             authors=authors,
             published=published,
             arxiv_id=arxiv_id,
@@ -90,9 +106,13 @@ class ArxivSource(BaseSource):
             is_open_access=True,
         )
 
+    def _title_and_abstract(self, entry: Any) -> Tuple[str, str]:
+        """Return the cleaned title and the abstract of an entry."""
+        return self._clean_title(entry.get("title", "")), entry.get("summary", "")
+
     def _extract_arxiv_id(self, url: str) -> Optional[str]:
         """Extract arXiv ID from URL."""
-        match = re.search(r"arxiv\.org/abs/(\d{4}\.\d{4,5}(?:v\d+)?)", url)
+        match = _ARXIV_ID_RE.search(url)
         if match:
             return match.group(1)
         return None
@@ -101,9 +121,10 @@ class ArxivSource(BaseSource):
         """Parse authors from arXiv RSS entry."""
         authors = []
 
-        if hasattr(entry, "authors") and entry.authors:
+        entry_authors = entry.get("authors")
+        if entry_authors:
             # arXiv RSS puts all authors in first element, comma-separated
-            author_string = entry.authors[0].get("name", "")
+            author_string = entry_authors[0].get("name", "")
             author_names = [name.strip() for name in author_string.split(",")]
 
             for name in author_names:
@@ -118,21 +139,7 @@ class ArxivSource(BaseSource):
         if not date_str:
             return None
 
-        # Try common date formats
-        formats = [
-            "%a, %d %b %Y %H:%M:%S %Z",
-            "%Y-%m-%dT%H:%M:%S%z",
-            "%Y-%m-%dT%H:%M:%SZ",
-            "%Y-%m-%d",
-        ]
-
-        for fmt in formats:
-            try:
-                return datetime.strptime(date_str, fmt)
-            except ValueError:
-                continue
-
-        return None
+        return self._parse_date_string(date_str, _DATE_FORMATS)
 
     def _clean_title(self, title: str) -> str:
         """Clean up title (remove extra whitespace, newlines)."""
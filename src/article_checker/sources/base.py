@@ -1,9 +1,36 @@
 """Abstract base class for paper sources."""
 
+import logging
+import re
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import feedparser
+import requests
+from requests.adapters import HTTPAdapter
 
 from ..models import Paper
+from .feed_cache import FeedCache
+
+logger = logging.getLogger(__name__)
+
+FEED_TIMEOUT = (5, 30)  # (connect, read) seconds
+
+# Shared across sources and fetch threads so feeds on the same host
+# (arxiv.org, aps.org, ...) reuse pooled keep-alive connections
+_session = requests.Session()
+_session.headers.update({"User-Agent": "ArticleChecker/1.0"})
+_session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+_session.mount("http://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+
+
+@lru_cache(maxsize=64)
+def _compile_keywords(keywords: Tuple[str, ...]) -> re.Pattern:
+    """Compile keywords into one case-insensitive alternation pattern."""
+    return re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
 
 
 class BaseSource(ABC):
@@ -14,16 +41,40 @@ class BaseSource(ABC):
     to provide a unified way to fetch and filter papers.
     """
 
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], feed_cache: Optional[FeedCache] = None):
         """
         Initialize the source with configuration.
 
         Args:
             config: Source-specific configuration dictionary
+            feed_cache: Optional cache enabling conditional feed requests
         """
         self.config = config
+        self.feed_cache = feed_cache
         self.name = config.get("name", self.__class__.__name__)
 
+        # A feed uses one date format throughout; remember the last match
+        self._preferred_date_fmt: Optional[str] = None
+
+        # Keyword lists are fixed per source; lowercase them once here
+        keyword_config = config.get("filters", {}).get("keywords", {})
+        self._keyword_filter_enabled = keyword_config.get("enabled", False)
+        self._include = tuple(keyword_config.get("include") or ())
+        self._exclude = tuple(keyword_config.get("exclude") or ())
+        self._include_lower = tuple(k.lower() for k in self._include)
+
+        # Optional per-feed cap on entries; None means no cap
+        max_entries = config.get("max_entries")
+        if max_entries is not None and (
+            not isinstance(max_entries, int) or isinstance(max_entries, bool) or max_entries < 0
+        ):
+            logger.warning(
+                f"Ignoring invalid max_entries {max_entries!r} for {self.name}; "
+                f"expected a non-negative integer"
+            )
+            max_entries = None
+        self._max_entries: Optional[int] = max_entries
+
     @abstractmethod
     def fetch(self) -> List[Paper]:
         """
@@ -35,47 +86,158 @@ class BaseSource(ABC):
         raise Exception("Not implemented")
 
     @abstractmethod
-    def _parse_entry(self, entry: Any) -> Paper:
+    def _parse_entry(
+        self, entry: Any, title_and_abstract: Optional[Tuple[str, str]] = None
+    ) -> Paper:
         """
         Parse a single feed entry into a Paper object.
 
         Args:
             entry: Feed entry (format depends on source)
+            title_and_abstract: Cleaned title and abstract if already extracted
 
         Returns:
             Paper object
         """
         raise Exception("Not implemented")
 
-    def _apply_keyword_filter(
-        self, text: str, include: List[str], exclude: List[str]
-    ) -> tuple[bool, List[str]]:
+    def _fetch_feed(self, url: str) -> feedparser.FeedParserDict:
+        """
+        Download a feed over the shared session and parse it.
+
+        Network errors are reported like feedparser's own: an empty feed
+        with ``bozo`` set, so callers handle both the same way. With a feed
+        cache, unchanged feeds (HTTP 304) are parsed from the cached body.
+
+        Args:
+            url: Feed URL
+
+        Returns:
+            Parsed feed
+        """
+        request_headers = self.feed_cache.request_headers(url) if self.feed_cache else {}
+        cached = None
+        try:
+            response = _session.get(url, headers=request_headers, timeout=FEED_TIMEOUT)
+            response.raise_for_status()
+            if response.status_code == 304 and self.feed_cache:
+                cached = self.feed_cache.load(url)
+                if cached is None:
+                    # Cached body is unusable: forget it and fetch in full
+                    self.feed_cache.discard(url)
+                    response = _session.get(url, timeout=FEED_TIMEOUT)
+                    response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            return feedparser.FeedParserDict(entries=[], bozo=True, bozo_exception=e)
+
+        # Headers carry the declared charset and base URL; feedparser
+        # expects lowercase names
+        headers = {k.lower(): v for k, v in response.headers.items()}
+        headers["content-location"] = response.url
+        content = response.content
+
+        if cached:
+            content, headers["content-type"] = cached
+            logger.debug(f"Feed not modified, using cached copy: {url}")
+        elif self.feed_cache and response.status_code == 200:
+            self.feed_cache.store(url, content, headers)
+
+        # Only entry links are used as URLs, and those are resolved either
+        # way; sanitizing stays on because abstracts go into the email HTML
+        return feedparser.parse(
+            content, response_headers=headers, resolve_relative_uris=False
+        )
+
+    def _parse_date_string(self, date_str: str, formats: Sequence[str]) -> Optional[datetime]:
+        """
+        Parse a feed date string.
+
+        RFC 822 (RSS pubDate) and ISO 8601 (Atom, dc:date) dates are handled
+        by the stdlib parsers directly; anything else falls back to strptime.
+
+        Args:
+            date_str: Date string from the feed
+            formats: Fallback strptime formats, in priority order
+
+        Returns:
+            Parsed datetime, or None if unparsable
+        """
+        try:
+            return parsedate_to_datetime(date_str)
+        except (TypeError, ValueError):
+            pass
+        try:
+            return datetime.fromisoformat(date_str)
+        except ValueError:
+            pass
+        return self._strptime_any(date_str, formats)
+
+    def _strptime_any(self, date_str: str, formats: Sequence[str]) -> Optional[datetime]:
+        """
+        Parse a date with the first matching format.
+
+        The format that matched last time is tried first, so most entries
+        of a feed parse on the first attempt.
+
+        Args:
+            date_str: Date string from the feed
+            formats: Candidate strptime formats, in priority order
+
+        Returns:
+            Parsed datetime, or None if no format matches
         """
-        Apply keyword filtering to text.
+        preferred = self._preferred_date_fmt
+        if preferred is not None:
+            try:
+                return datetime.strptime(date_str, preferred)
+            except ValueError:
+                pass
+
+        for fmt in formats:
+            if fmt == preferred:
+                continue
+            try:
+                parsed = datetime.strptime(date_str, fmt)
+            except ValueError:
+                continue
+            self._preferred_date_fmt = fmt
+            return parsed
+
+        return None
+
+    def _apply_keyword_filter(self, text: str) -> tuple[bool, List[str]]:
+        """
+        Apply the source's keyword filter to text.
+
+        Include keywords use OR logic; any exclude keyword rejects the text.
 
         Args:
             text: Text to search (title + abstract)
-            include: Keywords that must be present (OR logic)
-            exclude: Keywords that must not be present
 
         Returns:
             Tuple of (passes_filter, matched_keywords)
         """
-        text_lower = text.lower()
-
         # Check exclude keywords first
-        for keyword in exclude:
-            if keyword.lower() in text_lower:
-                return False, []
+        if self._exclude and _compile_keywords(self._exclude).search(text):
+            return False, []
 
-        # Check include keywords
-        matched = []
-        for keyword in include:
-            if keyword.lower() in text_lower:
-                matched.append(keyword)
+        if not self._include:
+            return True, []
+
+        # Single regex pass rejects texts without any include keyword
+        if not _compile_keywords(self._include).search(text):
+            return False, []
+
+        # Collect every matched keyword (alternation alone misses overlaps)
+        text_lower = text.lower()
+        matched = [
+            keyword
+            for keyword, keyword_lower in zip(self._include, self._include_lower)
+            if keyword_lower in text_lower
+        ]
 
         # If include list is specified, at least one must match
-        if include and not matched:
+        if not matched:
             return False, []
 
         return True, matched
@@ -0,0 +1,136 @@
+"""On-disk cache of feed bodies for conditional HTTP requests."""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class FeedCache:
+    """
+    Remember each feed's ETag / Last-Modified validators and last body.
+
+    Sources send the validators as If-None-Match / If-Modified-Since; on a
+    304 response the stored body is parsed again instead of downloading it.
+    The body is kept (rather than treating 304 as "no papers") because
+    unsent papers from an unchanged feed must still reach the sent-papers
+    filter, e.g. after a failed email or a max_papers_per_run cut.
+
+    Validators are written by save(); bodies are written as they arrive.
+    """
+
+    def __init__(self, cache_dir: Path):
+        """
+        Args:
+            cache_dir: Directory for the index file and feed bodies
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._index_file = self.cache_dir / "feeds.json"
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._index: Dict[str, Dict[str, Any]] = self._load_index()
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """Load the URL -> validators index, returning empty dict on error."""
+        if not self._index_file.exists():
+            return {}
+        try:
+            with open(self._index_file, "r") as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"Failed to load feed cache {self._index_file}: {e}")
+            return {}
+
+    def _body_path(self, url: str) -> Path:
+        """Return the file holding the cached body for a URL."""
+        digest = hashlib.md5(url.encode(), usedforsecurity=False).hexdigest()
+        return self.cache_dir / f"{digest}.xml"
+
+    def request_headers(self, url: str) -> Dict[str, str]:
+        """
+        Conditional request headers for a URL.
+
+        Returns:
+            If-None-Match / If-Modified-Since headers, or an empty dict when
+            nothing usable is cached
+        """
+        with self._lock:
+            record = self._index.get(url)
+        if not record or not self._body_path(url).exists():
+            return {}
+        headers = {}
+        if record.get("etag"):
+            headers["If-None-Match"] = record["etag"]
+        if record.get("last_modified"):
+            headers["If-Modified-Since"] = record["last_modified"]
+        return headers
+
+    def load(self, url: str) -> Optional[Tuple[bytes, str]]:
+        """
+        Return the cached (body, content_type) for a URL.
+
+        Returns:
+            Tuple of body bytes and Content-Type header, or None if missing
+        """
+        with self._lock:
+            record = self._index.get(url)
+        if not record:
+            return None
+        try:
+            body = self._body_path(url).read_bytes()
+        except OSError as e:
+            logger.warning(f"Failed to read cached feed for {url}: {e}")
+            return None
+        return body, record.get("content_type", "")
+
+    def store(self, url: str, body: bytes, headers: Dict[str, str]) -> None:
+        """
+        Cache a freshly downloaded feed.
+
+        Args:
+            url: Feed URL
+            body: Raw response body
+            headers: Response headers (lowercase names)
+        """
+        etag = headers.get("etag")
+        last_modified = headers.get("last-modified")
+        if not etag and not last_modified:
+            # The server cannot answer conditional requests; nothing to gain
+            return
+        try:
+            self._body_path(url).write_bytes(body)
+        except OSError as e:
+            logger.warning(f"Failed to cache feed for {url}: {e}")
+            return
+        with self._lock:
+            self._index[url] = {
+                "etag": etag or "",
+                "last_modified": last_modified or "",
+                "content_type": headers.get("content-type", ""),
+                "fetched_at_ts": time.time(),
+            }
+            self._dirty = True
+
+    def discard(self, url: str) -> None:
+        """Forget the validators for a URL so the next request is unconditional."""
+        with self._lock:
+            if self._index.pop(url, None) is not None:
+                self._dirty = True
+
+    def save(self) -> None:
+        """Write the validators index if anything changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                with open(self._index_file, "w") as f:
+                    json.dump(self._index, f, separators=(",", ":"))
+                self._dirty = False
+            except Exception as e:
+                logger.warning(f"Failed to save feed cache {self._index_file}: {e}")
@@ -3,15 +3,27 @@
 import logging
 import re
 from datetime import datetime
-from typing import Any, List, Optional
-
-import feedparser
+from itertools import islice
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..models import Author, Paper, parse_author_name
 from .base import BaseSource
+from .feed_cache import FeedCache
 
 logger = logging.getLogger(__name__)
 
+_DOI_RE = re.compile(r"(10\.\d{4,}/[^\s]+)")
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+# Fallback date formats for strings the ISO and RFC 822 parsers reject
+_DATE_FORMATS = (
+    "%a, %d %b %Y %H:%M:%S %Z",
+    "%a, %d %b %Y %H:%M:%S %z",
+    "%Y-%m-%dT%H:%M:%S%z",
+    "%Y-%m-%dT%H:%M:%SZ",
+    "%Y-%m-%d",
+)
+
 
 class JournalSource(BaseSource):
     """
@@ -23,37 +35,39 @@ class JournalSource(BaseSource):
     - Quantum (quantum-journal.org)
     """
 
+    def __init__(self, config: Dict[str, Any], feed_cache: Optional[FeedCache] = None):
+        super().__init__(config, feed_cache)
+        # Per-journal settings are the same for every entry; resolve them once here
+        self._journal_name = config.get("name", "Unknown Journal")
+        self._source_symbol = config.get("symbol", self._journal_name)
+        self._open_access = config.get("open_access", False)
+
     def fetch(self) -> List[Paper]:
         """Fetch and filter papers from journal RSS feed."""
         papers = []
         url = self.config["url"]
-        journal_name = self.config.get("name", "Unknown Journal")
+        journal_name = self._journal_name
 
         logger.info(f"Fetching journal feed: {journal_name} ({url})")
-        feed = feedparser.parse(url)
+        feed = self._fetch_feed(url)
 
         if feed.bozo:
             logger.warning(f"Feed parsing warning for {url}: {feed.bozo_exception}")
 
-        filters = self.config.get("filters", {})
-        keyword_config = filters.get("keywords", {})
-
-        for entry in feed.entries:
+        # Optional per-feed cap; feeds list the newest entries first
+        for entry in islice(feed.entries, self._max_entries):
             try:
-                paper = self._parse_entry(entry)
-                paper.source = journal_name
-                paper.source_symbol = self.config.get("symbol", journal_name)
-
-                # Apply keyword filter if enabled
-                if keyword_config.get("enabled", False):
-                    include_keywords = keyword_config.get("include", [])
-                    exclude_keywords = keyword_config.get("exclude", [])
-                    text = f"{paper.title} {paper.abstract}"
-                    passes, matched = self._apply_keyword_filter(
-                        text, include_keywords, exclude_keywords
-                    )
+                # Apply keyword filter if enabled, before the full parse so
+                # rejected entries skip author and date parsing
+                text_fields = None
+                if self._keyword_filter_enabled:
+                    text_fields = self._title_and_abstract(entry)
+                    passes, matched = self._apply_keyword_filter(" ".join(text_fields))
                     if not passes:
                         continue
+
+                paper = self._parse_entry(entry, text_fields)
+                if self._keyword_filter_enabled:
                     paper.keywords_matched = matched
 
                 papers.append(paper)
@@ -65,7 +79,9 @@ class JournalSource(BaseSource):
         logger.info(f"Found {len(papers)} papers from {journal_name}")
         return papers
 
-    def _parse_entry(self, entry: Any) -> Paper:
+    def _parse_entry(
+        self, entry: Any, title_and_abstract: Optional[Tuple[str, str]] = None
+    ) -> Paper:
         """Parse a journal RSS entry into a Paper object."""
         # Extract DOI if available
         doi = self._extract_doi(entry)
@@ -76,30 +92,36 @@ class JournalSource(BaseSource):
         # Parse publication date
         published = self._parse_date(entry)
 
-        # Determine if open access
-        is_open_access = self.config.get("open_access", False)
+        title, abstract = title_and_abstract or self._title_and_abstract(entry)
 
         return Paper(
             id=doi or entry.get("id", entry.get("link", "")),
-            title=self._clean_title(entry.get("title", "")),
+            title=title,
             url=entry.get("link", ""),
-            source=self.config.get("name", "Journal"),
-            abstract=entry.get("summary", entry.get("description", "")),
+            source=self._journal_name,
+            source_symbol=self._source_symbol,
+            abstract=abstract,
             authors=authors,
             published=published,
             doi=doi,
-            is_open_access=is_open_access,
+            is_open_access=self._open_access,
         )
 
+    def _title_and_abstract(self, entry: Any) -> Tuple[str, str]:
+        """Return the cleaned title and the abstract of an entry."""
+        title = self._clean_title(entry.get("title", ""))
+        return title, entry.get("summary", entry.get("description", ""))
+
     def _extract_doi(self, entry: Any) -> Optional[str]:
         """Extract DOI from entry."""
         # Try dc:identifier field (common in APS feeds)
-        if hasattr(entry, "dc_identifier"):
-            return entry.dc_identifier
+        dc_identifier = entry.get("dc_identifier")
+        if dc_identifier is not None:
+            return dc_identifier
 
         # Try to extract from link
         link = entry.get("link", "")
-        doi_match = re.search(r"(10\.\d{4,}/[^\s]+)", link)
+        doi_match = _DOI_RE.search(link)
         if doi_match:
             return doi_match.group(1)
 
@@ -110,24 +132,25 @@ class JournalSource(BaseSource):
         authors = []
 
         # Try 'authors' field (list of dicts)
-        if hasattr(entry, "authors") and entry.authors:
-            for author in entry.authors:
+        entry_authors = entry.get("authors")
+        if entry_authors:
+            for author in entry_authors:
                 name = author.get("name", "")
                 if name:
                     authors.append(Author(name=parse_author_name(name)))
 
         # Try 'author' field (single string)
-        elif hasattr(entry, "author") and entry.author:
-            authors.append(Author(name=parse_author_name(entry.author)))
+        elif entry.get("author"):
+            authors.append(Author(name=parse_author_name(entry["author"])))
 
         # Try dc:creator field (common in some feeds)
-        elif hasattr(entry, "dc_creator"):
-            if isinstance(entry.dc_creator, list):
-                for name in entry.dc_creator:
+        elif (dc_creator := entry.get("dc_creator")) is not None:
+            if isinstance(dc_creator, list):
+                for name in dc_creator:
                     if name:
                         authors.append(Author(name=parse_author_name(name)))
             else:
-                authors.append(Author(name=parse_author_name(entry.dc_creator)))
+                authors.append(Author(name=parse_author_name(dc_creator)))
 
         return authors
 
@@ -136,32 +159,19 @@ class JournalSource(BaseSource):
         date_str = entry.get("published", entry.get("updated", ""))
 
         # Try dc:date field
-        if not date_str and hasattr(entry, "dc_date"):
-            date_str = entry.dc_date
+        if not date_str:
+            date_str = entry.get("dc_date")
 
         if not date_str:
             return None
 
-        # Try common date formats
-        formats = [
-            "%a, %d %b %Y %H:%M:%S %Z",
-            "%a, %d %b %Y %H:%M:%S %z",
-            "%Y-%m-%dT%H:%M:%S%z",
-            "%Y-%m-%dT%H:%M:%SZ",
-            "%Y-%m-%d",
-        ]
-
-        for fmt in formats:
-            try:
-                return datetime.strptime(date_str, fmt)
-            except ValueError:
-                continue
-
-        return None
+        return self._parse_date_string(date_str, _DATE_FORMATS)
 
     def _clean_title(self, title: str) -> str:
         """Clean up title (remove extra whitespace, newlines, HTML tags)."""
-        # Remove HTML tags
-        title = re.sub(r"<[^>]+>", "", title)
+        # Remove HTML tags (dropped, not replaced by spaces, so "H<sub>2</sub>O"
+        # stays "H2O"); most titles have none, so skip the regex for those
+        if "<" in title:
+            title = _HTML_TAG_RE.sub("", title)
         # Normalize whitespace
         return " ".join(title.split())